@@ -11,7 +11,7 @@ from clps.constants import VALID_SKIP_CODES
 import clps.survey_vars.utils as svu
 import clps.transform as transform
 from clps.survey_vars.utils import SurveyVars
-from clps.transform import transform_data
+from clps.transform import filter_data, narrow_dtypes, transform_data
 # Hot reloading of modules doesn't seem to work, although apparently it should
 # be solved.
 # Reload the modules during local development to avoid restarting the server.
@@ -45,6 +45,11 @@ LABEL_WEIGHTED = 'Weighted Count'  # y label for weighted charts
 LABEL_UNWEIGHTED = 'Count'  # y label for unweighted charts
 LABEL_SELECT_VAR = 'Category'  # tooltip label for selected survey variable
 LABEL_GROUPBY_VAR = 'Sub-group'  # tooltip label for groupby variable
+# Valid skip handling options, with their display labels, in display order
+VALID_SKIP_LABELS = {
+    VALID_SKIP_CODES.RECODE: "Recode to 'No'",
+    VALID_SKIP_CODES.REMOVE: "Remove valid skips",
+    VALID_SKIP_CODES.LEAVE: "Leave as original data"}
 #
 DATATABLE_HEADER_CSS = 'css/datatable_header.css'
 
@@ -91,7 +96,7 @@ def deploy_survey_var_selectbox(
 def deploy_region_selectbox(survey_vars: SurveyVars) -> int | None:
     """Deploy a selectbox to filter the data by region."""
     regions = survey_vars.get_region()
-    opts = [None] + regions.codes
+    opts = [None, *regions.codes]
     return st.selectbox(
         label='Region',
         options=opts,
@@ -166,15 +171,8 @@ def deploy_valid_skip_selectbox(
         # Deploy the selectbox
         return st.selectbox(
             label='Valid skip handling:',
-            options=[VALID_SKIP_CODES.RECODE,
-                     VALID_SKIP_CODES.REMOVE,
-                     VALID_SKIP_CODES.LEAVE
-                     ],
-            format_func=lambda k:
-                {VALID_SKIP_CODES.RECODE: "Recode to 'No'",
-                 VALID_SKIP_CODES.REMOVE: "Remove valid skips",
-                 VALID_SKIP_CODES.LEAVE: "Leave as original data"}
-                [k]
+            options=list(VALID_SKIP_LABELS),
+            format_func=VALID_SKIP_LABELS.__getitem__
             )
     else:
         return None
@@ -339,13 +337,32 @@ def load_config() -> dict:
 
 @st.cache_data
 def load_data(fp: str | Path) -> pd.DataFrame:
-    return pd.read_csv(fp)
+    return narrow_dtypes(pd.read_csv(fp))
 
 
-# REFACTOR: currently uncached.
-# Cacheing is possible when returned object is pickle serializable.
-# Will need to investigate why SurveyVars is not picklable.
-def load_survey_vars(fp: str | Path):
+@st.cache_data(max_entries=32)
+def load_filtered_data(
+        fp: str | Path,
+        region: int | None,
+        selected_var: str,
+        groupby_var: str | None) -> pd.DataFrame:
+    """Load the main data, filtered by region and to the variable columns.
+
+    Cached separately from the rest of the transform, so that changing only
+    the aggregation options (e.g. weighting or valid skip handling) reuses
+    the filtered data.
+    """
+    return filter_data(load_data(fp), region, selected_var, groupby_var)
+
+
+@st.cache_resource
+def load_survey_vars(fp: str | Path) -> SurveyVars:
+    """Load the survey vars codebook info.
+
+    Cached as a resource, so one shared instance is returned on every rerun
+    without being copied. Survey var fields can't be reassigned, their
+    answer section sequences are tuples, and dicts are returned as copies.
+    """
     return SurveyVars(fp)
 
 
@@ -355,11 +372,12 @@ def main(debug=False, log_file_path: str | None = None):
 
     # Load configuation YAML file
     config = load_config()
-    # Load main data and survey vars codebook info
+    # Main data file path, and load survey vars codebook info.
+    # The main data is loaded (and filtered) after the selection widgets.
     if config['data']['use_clps_compressed']:
-        clps_df = load_data(config['data']['clps_compressed'])
+        clps_fp = config['data']['clps_compressed']
     else:
-        clps_df = load_data(config['data']['clps_file'])
+        clps_fp = config['data']['clps_file']
     svs = load_survey_vars(config['data']['survey_vars_file'])
 
     # BEGIN: DATA SELECTION WIDGETS AND UI
@@ -383,11 +401,14 @@ def main(debug=False, log_file_path: str | None = None):
     make_gap(3)
     # END: DATA SELECTION WIDGETS AND UI
 
+    # Load data filtered by region and selected/groupby variables
+    clps_df = load_filtered_data(clps_fp, region, selected_var, groupby_var)
     # Transform data
     clps_df = transform_data(
         df=clps_df,
         survey_vars=svs,
-        region=region,
+        # Already filtered by region
+        region=None,
         selected_var=selected_var,
         groupby_var=groupby_var,
         valid_skip_handling=valid_skip_handling,
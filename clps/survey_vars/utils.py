@@ -1,4 +1,6 @@
 import json
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import Literal
 from clps.survey_vars import json_keys as SVK
@@ -6,17 +8,53 @@ import clps.constants as N
 from copy import deepcopy
 
 
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class _SurveyVar:
     """A class to represent a survey variable for convenient access.
 
     Handles dealing with PROBCNTP as a special case.
-    """
 
-    def __init__(
-            self,
+    Instances should be created with `_SurveyVar.from_raw()` from a survey
+    variable dictionary. The dataclass is frozen and slotted, so fields are
+    read-only and attribute access skips the instance dict. Answer section
+    sequences are stored as tuples, so they can be shared without copying,
+    while the totals and raw dicts are returned as copies.
+    """
+    name: str
+    length: str
+    position: str
+    question_name: str
+    concept: str
+    question_text: str
+    universe: str
+    note: str
+    source: str
+    ans_cats: tuple[str, ...] | None = None
+    codes: tuple[int, ...] | tuple[str, ...] | None = None
+    frequency: tuple[int, ...] | None = None
+    weighted_frequency: tuple[int, ...] | None = None
+    percent: tuple[float, ...] | None = None
+    # Totals dict, accessed via the `total`/`totals` properties as a copy.
+    _total: dict | None = None
+    # Original survey variable dict
+    _raw: dict = field(default_factory=dict)
+    # Lookup dicts by code, keyed by lookup type (see `_lookup_by_code`).
+    _lookup_tables: dict = field(default_factory=dict)
+    # PROBCNTP only: the original aggregated answer section.
+    _aggregate_ans_cats: tuple | None = None
+    _aggregate_codes: tuple | None = None
+    _aggregate_freqs: tuple | None = None
+    _aggregate_wt_freqs: tuple | None = None
+    _aggregate_percents: tuple | None = None
+    _aggregate_totals: dict | None = None
+
+    @classmethod
+    def from_raw(
+            cls,
             survey_var: dict,
-            attempt_int_conversion: bool = True) -> None:
-        """
+            attempt_int_conversion: bool = True) -> '_SurveyVar':
+        """Create a _SurveyVar from a survey variable dictionary.
+
         Args:
             survey_var: A survey variable dictionary, i.e. individual list
                 items.
@@ -24,34 +62,39 @@ class _SurveyVar:
                 integers. If this fails, codes will be left as strings.
         """
         # Make a copy of the original dict
-        raw = self._raw = survey_var.copy()
+        raw = survey_var.copy()
         # Insert the data
-        self._name = raw[SVK.VAR_NAME]
-        self._length = raw[SVK.LENGTH]
-        self._position = raw[SVK.POSITION]
-        self._question_name = raw[SVK.QUESTION_NAME]
-        self._concept = raw[SVK.CONCEPT]
-        self._question_text = raw[SVK.QUESTION_TEXT]
-        self._universe = raw[SVK.UNIVERSE]
-        self._note = raw[SVK.NOTE]
-        self._source = raw[SVK.SOURCE]
+        fields = {
+            'name': raw[SVK.VAR_NAME],
+            'length': raw[SVK.LENGTH],
+            'position': raw[SVK.POSITION],
+            'question_name': raw[SVK.QUESTION_NAME],
+            'concept': raw[SVK.CONCEPT],
+            'question_text': raw[SVK.QUESTION_TEXT],
+            'universe': raw[SVK.UNIVERSE],
+            'note': raw[SVK.NOTE],
+            'source': raw[SVK.SOURCE],
+        }
         # Skip answer section entirely for survey vars where it doesn't exist.
-        try:
-            raw[SVK.ANSWER_CATEGORIES]
-        except KeyError:
-            pass
-        else:
+        # Membership test rather than try/except: a single dict probe that
+        # says what it means, with no exception setup in the common case
+        # where the section is present.
+        if SVK.ANSWER_CATEGORIES in raw:
             # Handle PROBCNTP as a special case
-            if self._name == N.PROBCNTP_KEY:
-                self._handle_PROBCNTP_answer_section()
-                # PROCNTP has only aggregated frequencies etc,
-                # so don't generate those lookups.
-                self._generate_lookup_by_code(
-                    freq=False, wt_freq=False, percent=False
-                )
+            if fields['name'] == N.PROBCNTP_KEY:
+                fields.update(cls._parse_PROBCNTP_answer_section(raw))
             else:
-                self._handle_answer_section(attempt_int_conversion)
-                self._generate_lookup_by_code()
+                fields.update(
+                    cls._parse_answer_section(raw, attempt_int_conversion))
+            # PROCNTP has only aggregated frequencies etc,
+            # so those lookups are not generated.
+            fields['_lookup_tables'] = cls._generate_lookup_by_code(
+                fields['codes'],
+                answer=fields['ans_cats'],
+                freq=fields.get('frequency'),
+                wtfreq=fields.get('weighted_frequency'),
+                percent=fields.get('percent'))
+        return cls(**fields, _raw=raw)
 
     def __repr__(self) -> str:
         # Use the underlying dict's repr
@@ -61,116 +104,114 @@ class _SurveyVar:
         # Use the underlying dict's str
         return self._raw.__str__()
 
-    def _handle_answer_section(self, attempt_int_conversion: bool) -> None:
-        """Handle the answer section of the survey variable.
+    @staticmethod
+    def _parse_answer_section(
+            raw: dict,
+            attempt_int_conversion: bool) -> dict:
+        """Parse the answer section of the survey variable.
 
         Args:
+            raw: The survey variable dictionary.
             attempt_int_conversion: Whether to attempt to convert codes to
                 integers. If this fails, codes will be left as strings.
+
+        Returns:
+            A dict of answer section field values, keyed by field name.
         """
-        self._ans_cats = self._raw[SVK.ANSWER_CATEGORIES]
-        self._codes = self._raw[SVK.CODE]
+        codes = tuple(raw[SVK.CODE])
         if attempt_int_conversion:
             try:
-                self._codes = [int(c) for c in self._codes]
+                codes = tuple(int(c) for c in codes)
             except ValueError:
                 pass
-        self._frequency = self._raw[SVK.FREQUENCY]
-        self._weighted_frequency = self._raw[SVK.WEIGHTED_FREQUENCY]
-        self._percent = self._raw[SVK.PERCENT]
-        self._total = self._raw[SVK.TOTAL]
-
-    def _handle_PROBCNTP_answer_section(self) -> None:
-        """Handles the answer section of the PROBCNTP survey variable.
+        # Frequencies etc. are stored as str in the JSON. Convert them once
+        # here so lookups don't have to on every call.
+        return {
+            'ans_cats': tuple(raw[SVK.ANSWER_CATEGORIES]),
+            'codes': codes,
+            'frequency': tuple(int(f) for f in raw[SVK.FREQUENCY]),
+            'weighted_frequency': tuple(
+                int(f) for f in raw[SVK.WEIGHTED_FREQUENCY]),
+            'percent': tuple(float(p) for p in raw[SVK.PERCENT]),
+            '_total': dict(raw[SVK.TOTAL]),
+        }
+
+    @staticmethod
+    def _parse_PROBCNTP_answer_section(raw: dict) -> dict:
+        """Parse the answer section of the PROBCNTP survey variable.
+
+        Keeps the aggregated data in private fields. Replaces the aggregated
+        '01-16' code with individual codes and corresponding answer
+        categories.
+
+        Frequency etc. are not filled in for PROBCNTP, as this cannot
+        be inferred from codebook information alone.
 
-        Creates several private attributes for the aggregated data. Replaces
-        the aggregated '01-16' code with individual codes and corresponding
-        answer categories.
+        Args:
+            raw: The PROBCNTP survey variable dictionary.
 
-        Frequency etc. lookups are not generated for PROBCNTP, as this cannot
-        be inferred from codebook information alone.
+        Returns:
+            A dict of answer section field values, keyed by field name.
         """
-        raw = self._raw
-        self._aggregate_ans_cats = raw[SVK.ANSWER_CATEGORIES]
-        self._aggregate_codes = raw[SVK.CODE]
-        self._aggregate_freqs = raw[SVK.FREQUENCY]
-        self._aggregate_wt_freqs = raw[SVK.WEIGHTED_FREQUENCY]
-        self._aggregate_percents = raw[SVK.PERCENT]
-        self._aggregate_totals = raw[SVK.TOTAL]
+        out = {
+            '_aggregate_ans_cats': tuple(raw[SVK.ANSWER_CATEGORIES]),
+            '_aggregate_codes': tuple(raw[SVK.CODE]),
+            '_aggregate_freqs': tuple(raw[SVK.FREQUENCY]),
+            '_aggregate_wt_freqs': tuple(raw[SVK.WEIGHTED_FREQUENCY]),
+            '_aggregate_percents': tuple(raw[SVK.PERCENT]),
+            '_aggregate_totals': dict(raw[SVK.TOTAL]),
+        }
         # Copy out the aggregate codes
-        codes = self._aggregate_codes.copy()
+        codes = list(out['_aggregate_codes'])
         # Position of the 01-16 str code
         agg_code_idx = codes.index(N.PROBCNTP_AGGREGATE_CODE)
-        # Remove the aggregate code
-        agg_code = codes.pop(agg_code_idx)
+        agg_code = codes[agg_code_idx]
         # Generate individual codes from '01-16'.
         # This probably could be hard coded instead.
         start, end = tuple([int(c) for c in agg_code.split('-')])
         indiv_codes = list(range(start, end + 1))
-        # Insert the individual codes back into the code list.
-        indiv_codes.reverse()
-        for c in indiv_codes:
-            codes.insert(agg_code_idx, c)
-        codes = [int(c) for c in codes]
-
-        # Copy out the aggregate answer category, then remove it.
-        ans_cats = self._aggregate_ans_cats.copy()
-        # Remove the aggregate answer category
-        ans_cats.pop(agg_code_idx)
-        # Insert the NEW individual answer categories.
+        # Replace the aggregate code with the individual codes.
+        # A single slice assignment avoids repeated O(n) inserts.
+        codes[agg_code_idx:agg_code_idx + 1] = indiv_codes
+        codes = tuple(int(c) for c in codes)
+
+        # Copy out the aggregate answer categories, then replace the
+        # aggregate answer category with the NEW individual answer categories.
         # Originally, was going to append the code to the "Number of ..."
         # string, but that makes the labels kind of repetitive.
         # Instead, just use the code, as the x axis label explains
         # it anyways.
-        indiv_ans_cats = [f'{c}' for c in indiv_codes]
-        for a in indiv_ans_cats:
-            ans_cats.insert(agg_code_idx, a)
+        ans_cats = list(out['_aggregate_ans_cats'])
+        ans_cats[agg_code_idx:agg_code_idx + 1] = [
+            f'{c}' for c in indiv_codes]
 
-        self._ans_cats = ans_cats
-        self._codes = codes
-
-        # Raise if user tries to access frequency lookups etc.
-        def error_func(self) -> None:
-            raise NotImplementedError(
-                "PROBCNTP frequency/weighted frequency/percent lookup is not "
-                "implemented yet."
-            )
-        self.lookup_freq = error_func
-        self.lookup_wt_freq = error_func
-        self.lookup_percent = error_func
+        out['ans_cats'] = tuple(ans_cats)
+        out['codes'] = codes
+        return out
 
+    @staticmethod
     def _generate_lookup_by_code(
-            self,
-            ans: bool = True,
-            freq: bool = True,
-            wt_freq: bool = True,
-            percent: bool = True) -> str:
+            codes: tuple,
+            **values: tuple | None) -> dict[str, dict]:
         """Generate code lookup dicts for answer categories, etc.
 
         Args:
-            ans: Whether to generate the answer category lookup.
-            freq: Whether to generate the frequency lookup.
-            wt_freq: Whether to generate the weighted frequency lookup.
-            percent: Whether to generate the percent lookup.
+            codes: The answer codes, used as keys for each lookup.
+            **values: Values to lookup by code, keyed by lookup type.
+                Values that are `None` are skipped.
+
+        Returns:
+            A dict of lookup dicts, keyed by lookup type.
         """
-        if ans:
-            self._ans_lookup = {
-                c: a for c, a in zip(self.codes, self.answer_categories)}
-        if freq:
-            self._freq_lookup = {
-                c: a for c, a in zip(self.codes, self.freqs)}
-        if wt_freq:
-            self._wt_freq_lookup = {
-                c: a for c, a in zip(self.codes, self.wt_freqs)}
-        if percent:
-            self._percent_lookup = {
-                c: a for c, a in zip(self.codes, self.percents)}
+        return {
+            k: dict(zip(codes, v))
+            for k, v in values.items() if v is not None}
 
     def _lookup_by_code(
             self,
             code: int | str,
             type: Literal['answer', 'freq', 'wtfreq', 'percent'],
-            suppress_missing: bool = True) -> str | None:
+            suppress_missing: bool = True) -> str | int | float | None:
         """Lookup answer category, frequency etc. by code.
 
         Backend for public lookup methods.
@@ -181,21 +222,19 @@ class _SurveyVar:
             type: The type of lookup to perform.
             suppress_missing: If the code doesn't exist, return None.
         """
-        # This try/except handles the case where the survey variable doesn't
+        if type not in ('answer', 'freq', 'wtfreq', 'percent'):
+            raise ValueError(f'Invalid type: {type}')
+        # Raise if user tries to access PROBCNTP frequency lookups etc.
+        if type != 'answer' and self._aggregate_codes is not None:
+            raise NotImplementedError(
+                "PROBCNTP frequency/weighted frequency/percent lookup is not "
+                "implemented yet."
+            )
+        # This handles the case where the survey variable doesn't
         # have an answer section.
         try:
-            match type:
-                case 'answer':
-                    lookup = self._ans_lookup
-                case 'freq':
-                    lookup = self._freq_lookup
-                case 'wtfreq':
-                    lookup = self._wt_freq_lookup
-                case 'percent':
-                    lookup = self._percent_lookup
-                case _:
-                    raise ValueError(f'Invalid type: {type}')
-        except AttributeError as e:
+            lookup = self._lookup_tables[type]
+        except KeyError as e:
             if suppress_missing:
                 return None
             else:
@@ -242,12 +281,12 @@ class _SurveyVar:
         Returns:
             Frequency corresponding to the code.
         """
-        return int(self._lookup_by_code(code, 'freq', suppress_missing))
+        return self._lookup_by_code(code, 'freq', suppress_missing)
 
     def lookup_wt_freq(
             self,
             code: int | str,
-            suppress_missing: bool = True) -> int:
+            suppress_missing: bool = True) -> int | None:
         """Lookup answer category by code.
 
         Args
@@ -258,12 +297,12 @@ class _SurveyVar:
         Returns:
             Weighted frequency corresponding to the code.
         """
-        return int(self._lookup_by_code(code, 'wtfreq', suppress_missing))
+        return self._lookup_by_code(code, 'wtfreq', suppress_missing)
 
     def lookup_percent(
             self,
             code: int | str,
-            suppress_missing: bool = True) -> float:
+            suppress_missing: bool = True) -> float | None:
         """Lookup answer category by code.
 
         Args
@@ -274,7 +313,7 @@ class _SurveyVar:
         Returns:
             Percent corresponding to the code.
         """
-        return float(self._lookup_by_code(code, 'percent', suppress_missing))
+        return self._lookup_by_code(code, 'percent', suppress_missing)
 
     def has_valid_skips(self) -> bool:
         """True if the survey variable has a 'Valid skip' category.
@@ -283,114 +322,54 @@ class _SurveyVar:
         answer categories at all.
         """
         # Check if answer categories exists
-        try:
-            self.ans_cats
-        except AttributeError:
+        if self.ans_cats is None:
             return False
         # Check for valid skips
         return N.VALID_SKIP in self.ans_cats
 
     """
-    Use properties to make the data read-only. For lists/dicts, return a copy
-    so the original list is not mutated by accident.
+    Aliases for fields, kept for convenience and backwards compatibility.
     """
     @property
     def raw(self) -> dict:
         return deepcopy(self._raw)
 
-    @property
-    def name(self) -> str:
-        return self._name
-
     @property
     def var_name(self) -> str:
-        return self._name
+        return self.name
 
     @property
-    def length(self) -> str:
-        return self._length
-
-    @property
-    def position(self) -> str:
-        return self._position
-
-    @property
-    def question_name(self) -> str:
-        return self._question_name
-
-    @property
-    def concept(self) -> str:
-        return self._concept
-
-    @property
-    def question_text(self) -> str:
-        return self._question_text
-
-    @property
-    def universe(self) -> str:
-        return self._universe
-
-    @property
-    def note(self) -> str:
-        return self._note
-
-    @property
-    def source(self) -> str:
-        return self._source
-
-    @property
-    def ans_cats(self) -> list[str] | None:
-        try:
-            return deepcopy(self._ans_cats)
-        except AttributeError:
-            return None
-
-    @property
-    def answer_categories(self) -> list[str] | None:
+    def answer_categories(self) -> tuple[str, ...] | None:
         return self.ans_cats
 
     @property
-    def codes(self) -> list[int] | list[str] | None:
-        try:
-            return deepcopy(self._codes)
-        except AttributeError:
-            return None
+    def freqs(self) -> tuple[int, ...] | None:
+        return self.frequency
 
     @property
-    def freqs(self) -> list[int] | None:
-        try:
-            return deepcopy(self._frequency)
-        except AttributeError:
-            return None
+    def frequencies(self) -> tuple[int, ...] | None:
+        return self.frequency
 
     @property
-    def frequencies(self) -> list[int] | None:
-        return deepcopy(self._freqs)
+    def wt_freqs(self) -> tuple[int, ...] | None:
+        return self.weighted_frequency
 
     @property
-    def wt_freqs(self) -> list[int] | None:
-        try:
-            return deepcopy(self._weighted_frequency)
-        except AttributeError:
-            return None
+    def weighted_frequencies(self) -> tuple[int, ...] | None:
+        return self.weighted_frequency
 
     @property
-    def weighted_frequencies(self) -> list[int] | None:
-        return self.wt_freqs
+    def percents(self) -> tuple[float, ...] | None:
+        return self.percent
 
     @property
-    def percents(self) -> list[float] | None:
-        try:
-            return deepcopy(self._percent)
-        except AttributeError:
-            return None
+    def total(self) -> dict | None:
+        # Return a copy so the shared dict is not mutated by accident.
+        return None if self._total is None else self._total.copy()
 
     @property
-    def totals(self) -> dict:
-        try:
-            return deepcopy(self._total)
-        except AttributeError:
-            return None
+    def totals(self) -> dict | None:
+        return self.total
 
 
 class SurveyVars:
@@ -413,7 +392,8 @@ class SurveyVars:
         # Keyed survey variables where each survey variable has been
         # initialized as a _SurveyVar object
         self._survey_vars = {
-            k: _SurveyVar(v) for k, v in self._survey_vars_raw.items()}
+            k: _SurveyVar.from_raw(v)
+            for k, v in self._survey_vars_raw.items()}
 
     def __repr__(self):
         return f"SurveyVars('{self._fp}')"
@@ -449,6 +429,18 @@ class SurveyVars:
         return self._survey_vars[N.REGION_KEY]
 
 
+def _read_json(fp: str | Path) -> list | dict:
+    """Read and parse a JSON file in one go.
+
+    Args:
+        fp: Path to the JSON file. `Path` objects are passed through as is.
+
+    Returns:
+        The parsed JSON data.
+    """
+    return json.loads(Path(fp).read_bytes())
+
+
 def load_survey_vars(fp: str | Path) -> list:
     """Load the survey variables from the JSON file as a list.
 
@@ -458,10 +450,7 @@ def load_survey_vars(fp: str | Path) -> list:
     Returns:
         A list of survey variables.
     """
-    if isinstance(fp, str):
-        fp = Path(fp)
-    with fp.open() as f:
-        return json.load(f)
+    return _read_json(fp)
 
 
 def load_keyed_survey_vars(fp: str | Path) -> dict:
@@ -473,8 +462,5 @@ def load_keyed_survey_vars(fp: str | Path) -> dict:
     Returns:
         A dictionary of survey variables with var name keys.
     """
-    if isinstance(fp, str):
-        fp = Path(fp)
-    with fp.open() as f:
-        data = json.load(f)
-    return {e[SVK.VAR_NAME]: e for e in data}
+    data = _read_json(fp)
+    return dict(zip(map(itemgetter(SVK.VAR_NAME), data), data))
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from clps.constants import (
     REGION_KEY, VALID_SKIP, WEIGHT_KEY)
@@ -5,55 +6,75 @@ from clps.survey_vars.utils import SurveyVars
 from typing import Literal
 
 
-def _filter_by_region(df: pd.DataFrame, region: int | None) -> pd.DataFrame:
-    """Filter CLPS raw dataframe by a region code.
+def narrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast integer columns of the CLPS raw dataframe to the smallest
+    integer dtype that holds their values.
+
+    Survey codes are small ints (< 100), so most columns become int8, cutting
+    the memory moved by each filter and aggregation. The weight column is
+    left as float64 to keep weighted sums exact to the original data.
 
     Args:
-        df: Dataframe to filter. Region column must be ints.
-        region: Region code to filter by. If `None`, no filtering is done.
+        df: CLPS raw dataframe, e.g. as loaded by `pd.read_csv`.
 
     Returns:
-        Filtered dataframe.
+        Dataframe with narrowed integer columns.
     """
-    if region is not None:
-        df = df[df[REGION_KEY] == region].copy()
-    return df
+    int_cols = df.select_dtypes('integer').columns
+    return df.assign(**{
+        c: pd.to_numeric(df[c], downcast='integer') for c in int_cols})
 
 
-def _filter_by_selected_and_groupby(
+def filter_data(
         df: pd.DataFrame,
+        region: int | None,
         selected_var: str,
         groupby_var: str | None) -> pd.DataFrame:
-    """Filter for the selected variable of interest, the groupby variable, and
-    the respondent weights.
+    """Filter CLPS raw dataframe by a region code, keeping only the selected
+    variable of interest, the groupby variable, and the respondent weights.
+
+    Rows are selected positionally from a plain NumPy comparison on the
+    region column, skipping pandas boolean indexing and alignment, and only
+    the kept columns are materialized.
 
     Args:
-        df: Dataframe with survey variables.
+        df: Dataframe to filter. Region column must be ints.
+        region: Region code to filter by. If `None`, no row filtering is done.
         selected_var: Name of the survey variable to filter for.
         groupby_var: Name of the groupby variable to filter for.
 
     Returns:
-        Dataframe with selected and/or groupby variable columns, and the weight
-        column.
+        Filtered dataframe with selected and/or groupby variable columns, and
+        the weight column.
     """
     if groupby_var is None:
-        df = df[[selected_var, WEIGHT_KEY]]
+        cols = [selected_var, WEIGHT_KEY]
     else:
-        df = df[[selected_var, groupby_var, WEIGHT_KEY]]
-    return df
+        cols = [selected_var, groupby_var, WEIGHT_KEY]
+    if region is None:
+        return df[cols]
+    rows = np.flatnonzero(df[REGION_KEY].to_numpy() == region)
+    return df[cols].take(rows)
 
 
-def _create_ordered_dtype(s: pd.Series) -> pd.CategoricalDtype:
+def _create_ordered_dtype(
+        s: pd.Series,
+        survey_vars: SurveyVars) -> pd.CategoricalDtype:
     """From an integer-containing column, create an ordered categorical dtype.
 
+    Categories are taken from the survey variable metadata rather than the
+    data itself, avoiding a sort and unique over the whole column.
+
     Args:
         s: Series corresponding to a survey variable, with integer codes.
+        survey_vars: SurveyVars object, with survey variable metadata.
 
     Returns:
-        Ordered categorical dtype, with categories in ascending integer order.
+        Ordered categorical dtype, with categories in the order found in the
+        survey variable metadata (i.e. ascending integer order).
     """
     return pd.CategoricalDtype(
-        categories=s.sort_values().unique(),
+        categories=survey_vars[s.name].codes,
         ordered=True)
 
 
@@ -77,7 +98,7 @@ def _order_and_convert_code(
     # then convert to text labels.
     # Renaming categories automatically converts category names.
     return (s
-            .astype(_create_ordered_dtype(s))
+            .astype(_create_ordered_dtype(s, survey_vars))
             .cat.rename_categories(
                 survey_vars[s.name].lookup_answer))
 
@@ -138,11 +159,21 @@ def _handle_valid_skips(
     if (valid_skip_handling is None) or (valid_skip_handling == 'leave'):
         pass
     elif valid_skip_handling == 'remove':
-        df = df.query(f"{selected_var} != '{VALID_SKIP}'")
-        df = df.assign(**{
-            selected_var:
-                lambda d: d[selected_var].cat.remove_unused_categories()
-        })
+        # Work on the integer category codes rather than the str labels.
+        categories = df[selected_var].cat.categories
+        if VALID_SKIP in categories:
+            skip_code = categories.get_loc(VALID_SKIP)
+            codes = df[selected_var].cat.codes.to_numpy()
+            keep = codes != skip_code
+            # Drop the valid skip category directly, shifting down the codes
+            # above it, rather than scanning for unused categories.
+            codes = codes[keep]
+            codes = np.where(codes > skip_code, codes - 1, codes)
+            df = df.iloc[keep].assign(**{
+                selected_var: pd.Categorical.from_codes(
+                    codes, categories.delete(skip_code),
+                    ordered=df[selected_var].cat.ordered)
+            })
     elif valid_skip_handling == 'recode':
         df = df.assign(**{
             selected_var:
@@ -163,6 +194,13 @@ def _groupby_and_aggregate(
         ) -> pd.DataFrame:
     """Groupby and aggregate the dataframe.
 
+    Intended to be run on the integer codes, before conversion to text
+    labels. Survey codes are small non-negative ints, so grouping is done
+    directly with `np.bincount` in a single pass, combining the selected and
+    groupby codes into one key if needed. Non-integer columns (e.g. VERDATE)
+    fall back to a regular pandas groupby.
+    Values are not rounded, see `_merge_and_round`.
+
     Args:
         df: Dataframe with survey variable columns.
         selected_var: Name of the survey variable column of interest.
@@ -170,25 +208,80 @@ def _groupby_and_aggregate(
         weighted: Calculate the weight sums. Otherwise, counts the rows,
             representing the number of respondents directly.
 
+    Returns:
+        Dataframe with one row per (selected, groupby) code combination
+        present in the data, sorted by code.
     """
     # Assemble grouping variables
     groupby_list = [selected_var]
     if groupby_var is not None:
         groupby_list.append(groupby_var)
-    # Groupby and aggregate
-    # Count the weight column to get the number of actual respondents
-    # otherwise sum up the weights.
-    grpby = df.groupby(groupby_list)[[WEIGHT_KEY]]  # groupby object
+    if not all(pd.api.types.is_integer_dtype(df[k]) for k in groupby_list):
+        # Count the weight column to get the number of actual respondents
+        # otherwise sum up the weights.
+        grpby = df.groupby(groupby_list)[[WEIGHT_KEY]]  # groupby object
+        if weighted:
+            out = grpby.sum()
+        else:
+            out = grpby.count()
+        return out.reset_index()
+    # Combine selected and groupby codes into a single key, i.e.
+    # key = selected * n_groupby + groupby.
+    # Codes may be narrowed (see `narrow_dtypes`), so widen them to avoid
+    # overflow when combining keys.
+    key = df[selected_var].to_numpy().astype(np.intp)
+    if groupby_var is not None:
+        grp = df[groupby_var].to_numpy()
+        n_grp = int(grp.max(initial=0)) + 1
+        # In-place ops avoid a second temporary key array.
+        key *= n_grp
+        key += grp
+    # Number of respondents for each key, also used to find keys present.
+    counts = np.bincount(key)
+    present = np.flatnonzero(counts)
     if weighted:
-        out = grpby.sum()
+        totals = np.bincount(key, weights=df[WEIGHT_KEY].to_numpy())
+    else:
+        totals = counts
+    # Split the keys back into codes.
+    if groupby_var is None:
+        out = {selected_var: present}
     else:
-        out = grpby.count()
+        out = {selected_var: present // n_grp, groupby_var: present % n_grp}
+    out[WEIGHT_KEY] = totals[present]
+    return pd.DataFrame(out)
+
+
+def _merge_and_round(
+        df: pd.DataFrame,
+        selected_var: str,
+        groupby_var: str | None) -> pd.DataFrame:
+    """Sum any rows sharing a label, then round to ints.
+
+    Recoding valid skips to "No" after aggregation leaves two rows labelled
+    "No" (per sub-group), so these are summed together here. Otherwise this
+    only rounds the aggregated values.
+
+    Args:
+        df: Aggregated dataframe with survey variable columns converted to
+            str ordered categorical dtype.
+        selected_var: Name of the survey variable column of interest.
+        groupby_var: Name of the groupby column, if any.
+
+    Returns:
+        Dataframe with integer counts/weighted counts.
+    """
+    groupby_list = [selected_var]
+    if groupby_var is not None:
+        groupby_list.append(groupby_var)
     # Note, streamlit appears to have issue with categorical indexes (possibly)
     # after groupbys, displaying a warning that "The value is not part of the
     # allowed options" along with a yellow exclamtion mark.
     # Resetting the index to get a clean dataframe here, then worry about
     # styling during display.
-    return (out
+    return (df
+            .groupby(groupby_list, observed=True)[[WEIGHT_KEY]]
+            .sum()
             .round()
             .astype(int)
             .reset_index()
@@ -219,14 +312,15 @@ def transform_data(
         weighted: Calculate the weight sums. Otherwise, counts the rows,
             representing the number of respondents directly.
     """
-    # Filter region rows.
-    df = _filter_by_region(df, region)
-    # Filter survey var columns.
-    df = _filter_by_selected_and_groupby(df, selected_var, groupby_var)
+    # Filter region rows and survey var columns.
+    df = filter_data(df, region, selected_var, groupby_var)
+    # Groupby and aggregate on the integer codes.
+    df = _groupby_and_aggregate(df, selected_var, groupby_var, weighted)
     # Replace integer codes with text labels, as ordered categorical dtype.
+    # Done after aggregation, so only a handful of rows are converted.
     df = _convert_to_categorical(df, survey_vars, selected_var, groupby_var)
     # Filter out valid skips
     df = _handle_valid_skips(df, selected_var, valid_skip_handling)
-    # Groupby and aggregate
-    df = _groupby_and_aggregate(df, selected_var, groupby_var, weighted)
+    # Merge recoded rows and round
+    df = _merge_and_round(df, selected_var, groupby_var)
     return df
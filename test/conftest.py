@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+from pathlib import Path
+import yaml
+from clps.survey_vars.utils import SurveyVars, load_keyed_survey_vars
+
+
+CONFIG_FP = 'config.yaml'
+
+
+def load_config() -> dict:
+    """Load the config file."""
+    with open(CONFIG_FP) as f:
+        return yaml.safe_load(f)
+
+
+"""
+Session scoped fixtures, so the data and survey variables are only loaded once
+for the whole test session, and only if a selected test needs them.
+"""
+
+
+@pytest.fixture(scope='session')
+def config() -> dict:
+    return load_config()
+
+
+@pytest.fixture(scope='session')
+def svs(config) -> SurveyVars:
+    """SurveyVars object."""
+    return SurveyVars(config['data']['survey_vars_file'])
+
+
+@pytest.fixture(scope='session')
+def raw_svs(config) -> dict:
+    """Dictionary version of the raw survey vars JSON, used as a testing
+    reference."""
+    return load_keyed_survey_vars(config['data']['survey_vars_file'])
+
+
+def load_cached_csv(fp: str, cache_dir: Path | None) -> pd.DataFrame:
+    """Load a CSV, via a pickled copy in `cache_dir` if one is up to date.
+
+    The pickle is keyed on the CSV name, size and modification time, and the
+    pandas version, so a changed CSV or pandas upgrade is re-read and
+    re-cached. Stale pickles for the CSV are removed when a new one is
+    written. Pickle is used rather than Parquet/Feather to avoid adding
+    pyarrow as a test dependency. If `cache_dir` is `None`, the CSV is read
+    directly.
+    """
+    if cache_dir is None:
+        return pd.read_csv(fp)
+    name = Path(fp).name
+    stat = Path(fp).stat()
+    cache = cache_dir / (
+        f'{name}-{stat.st_size}-{stat.st_mtime_ns}-{pd.__version__}.pkl')
+    if cache.exists():
+        return pd.read_pickle(cache)
+    df = pd.read_csv(fp)
+    for stale in cache_dir.glob(f'{name}-*.pkl'):
+        stale.unlink()
+    df.to_pickle(cache)
+    return df
+
+
+@pytest.fixture(scope='session')
+def df(config, pytestconfig) -> pd.DataFrame:
+    """Raw CLPS dataframe, cached between test runs in the pytest cache.
+
+    Falls back to reading the CSV if the cache plugin is disabled, e.g. with
+    `-p no:cacheprovider`.
+    """
+    cache = getattr(pytestconfig, 'cache', None)
+    return load_cached_csv(
+        config['data']['clps_compressed'],
+        cache.mkdir('clps_data') if cache is not None else None)
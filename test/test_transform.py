@@ -2,7 +2,6 @@ import pandas as pd
 from typing import Literal
 from clps.transform import transform_data
 from clps.survey_vars.utils import SurveyVars
-import yaml
 from copy import deepcopy
 from clps.constants import (
     WEIGHT_KEY,
@@ -24,20 +23,6 @@ from clps.constants import (
 from clps.constants import VALID_SKIP_CODES
 
 
-CONFIG_FP = 'config.yaml'
-
-
-def load_config() -> dict:
-    """Load the config file."""
-    with open(CONFIG_FP) as f:
-        return yaml.safe_load(f)
-
-
-config = load_config()
-
-svs = SurveyVars(config['data']['survey_vars_file'])
-df = pd.read_csv(config['data']['clps_compressed'])
-
 """
 In this section:
 pick several survey variables, and test them without filtering or grouping.
@@ -158,7 +143,7 @@ def raw_var_tester(
             weighted=True) == wt_freqs_copy
 
 
-def test_raw_var_DSHP20E() -> None:
+def test_raw_var_DSHP20E(df, svs) -> None:
     raw_var_tester(
         df=df,
         survey_vars=svs,
@@ -170,7 +155,7 @@ def test_raw_var_DSHP20E() -> None:
         )
 
 
-def test_raw_var_CSTP10EP() -> None:
+def test_raw_var_CSTP10EP(df, svs) -> None:
     raw_var_tester(
         df=df,
         survey_vars=svs,
@@ -181,7 +166,7 @@ def test_raw_var_CSTP10EP() -> None:
         no_number=2)
 
 
-def test_raw_var_AGEGRP() -> None:
+def test_raw_var_AGEGRP(df, svs) -> None:
     raw_var_tester(
         df=df,
         survey_vars=svs,
@@ -191,7 +176,7 @@ def test_raw_var_AGEGRP() -> None:
                   4_714_059, 5_201_210, 6_672_711])
 
 
-def test_raw_var_PRIP05N() -> None:
+def test_raw_var_PRIP05N(df, svs) -> None:
     raw_var_tester(
         df=df,
         survey_vars=svs,
@@ -267,15 +252,13 @@ def var_subgroup_tester(
     """
     Create reference values.
     """
-    correct = df.copy()
-    # Filter for region
+    # Filter for the subgroup, and region if any
+    mask = df[groupby_var].to_numpy() == subgroup_code
     if region is not None:
         region = REGION_LOOKUP[region]
-        correct = correct.loc[correct[REGION_KEY] == region]
-    # Filter for the subgroup
-    correct = correct.loc[correct[groupby_var] == subgroup_code]
-    # Drop unneeded columns
-    correct = correct[[selected_var, groupby_var, WEIGHT_KEY]]
+        mask &= df[REGION_KEY].to_numpy() == region
+    # Select rows and needed columns in one step
+    correct = df.loc[mask, [selected_var, groupby_var, WEIGHT_KEY]]
 
     # Aggregate by selected/groupby_var.
     # The only real difference is the count/sum step.
@@ -351,7 +334,7 @@ def var_subgroup_tester(
         assert calculate_freq_helper(result) == correct_wt_freq
 
 
-def test_var_subgroups_SERPROPB() -> None:
+def test_var_subgroups_SERPROPB(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -366,7 +349,7 @@ def test_var_subgroups_SERPROPB() -> None:
     )
 
 
-def test_var_subgroups_CHL10BP() -> None:
+def test_var_subgroups_CHL10BP(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -381,7 +364,7 @@ def test_var_subgroups_CHL10BP() -> None:
     )
 
 
-def test_var_subgroups_DSHP20G() -> None:
+def test_var_subgroups_DSHP20G(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -396,7 +379,7 @@ def test_var_subgroups_DSHP20G() -> None:
     )
 
 
-def test_var_subgroups_PRIP05K() -> None:
+def test_var_subgroups_PRIP05K(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -411,7 +394,7 @@ def test_var_subgroups_PRIP05K() -> None:
     )
 
 
-def test_var_subgroups_PRIP10B() -> None:
+def test_var_subgroups_PRIP10B(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -426,7 +409,7 @@ def test_var_subgroups_PRIP10B() -> None:
     )
 
 
-def test_var_subgroups_LANP04P() -> None:
+def test_var_subgroups_LANP04P(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -441,7 +424,7 @@ def test_var_subgroups_LANP04P() -> None:
     )
 
 
-def test_var_subgroups_HLTFLP() -> None:
+def test_var_subgroups_HLTFLP(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -457,7 +440,7 @@ def test_var_subgroups_HLTFLP() -> None:
     )
 
 
-def test_var_subgroups_FINFLP() -> None:
+def test_var_subgroups_FINFLP(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -472,7 +455,7 @@ def test_var_subgroups_FINFLP() -> None:
     )
 
 
-def test_var_subgroups_STAP40C() -> None:
+def test_var_subgroups_STAP40C(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -487,7 +470,7 @@ def test_var_subgroups_STAP40C() -> None:
     )
 
 
-def test_var_subgroups_SCPP20() -> None:
+def test_var_subgroups_SCPP20(df, svs) -> None:
     var_subgroup_tester(
         df=df,
         survey_vars=svs,
@@ -574,15 +557,13 @@ def var_subgroup_recode_tester(
     Create reference values.
     """
 
-    correct = df.copy()
-    # Filter for region
+    # Filter for the subgroup, and region if any
+    mask = df[groupby_var].to_numpy() == subgroup_code
     if region is not None:
         region = REGION_LOOKUP[region]
-        correct = correct.loc[correct[REGION_KEY] == region]
-    # Filter for the subgroup
-    correct = correct.loc[correct[groupby_var] == subgroup_code]
-    # Drop unneeded columns
-    correct = correct[[selected_var, groupby_var, WEIGHT_KEY]]
+        mask &= df[REGION_KEY].to_numpy() == region
+    # Select rows and needed columns in one step
+    correct = df.loc[mask, [selected_var, groupby_var, WEIGHT_KEY]]
     # Recode valid skip to No.
     correct[selected_var] = correct[selected_var].replace(
         valid_skip_code, no_code)
@@ -647,7 +628,7 @@ def var_subgroup_recode_tester(
     assert calculate_freq_helper(result) == correct_wt_freq
 
 
-def test_var_subgroups_recode_PRIP10A_YES() -> None:
+def test_var_subgroups_recode_PRIP10A_YES(df, svs) -> None:
     var_subgroup_recode_tester(
         df=df,
         survey_vars=svs,
@@ -661,7 +642,7 @@ def test_var_subgroups_recode_PRIP10A_YES() -> None:
     )
 
 
-def test_var_subgroups_recode_ASTP10C_NOT_STATED() -> None:
+def test_var_subgroups_recode_ASTP10C_NOT_STATED(df, svs) -> None:
     var_subgroup_recode_tester(
         df=df,
         survey_vars=svs,
@@ -675,7 +656,7 @@ def test_var_subgroups_recode_ASTP10C_NOT_STATED() -> None:
     )
 
 
-def test_var_subgroups_recode_ASTP10C_NO() -> None:
+def test_var_subgroups_recode_ASTP10C_NO(df, svs) -> None:
     var_subgroup_recode_tester(
         df=df,
         survey_vars=svs,
@@ -2,7 +2,9 @@ import pandas as pd
 import pytest
 from clps.constants import VALID_SKIP, YES, NO, NOT_STATED
 from clps.constants import VALID_SKIP_CODES
-from clps.transform import _handle_valid_skips
+from clps.constants import WEIGHT_KEY
+from clps.transform import (
+    _handle_valid_skips, _groupby_and_aggregate, narrow_dtypes)
 
 
 SELECTED_VAR = 'selected_var'
@@ -61,3 +63,34 @@ def test_handle_valid_skips_none(_handle_valid_skips_sample_data):
         .tolist()
     )
     assert result == [YES, NO, NOT_STATED]
+
+
+def test_groupby_and_aggregate() -> None:
+    data = pd.DataFrame({
+        SELECTED_VAR: [3, 1, 3, 1, 3],
+        GROUPBY_VAR: [2, 2, 0, 2, 2],
+        WEIGHT_KEY: [1.5, 2.0, 3.0, 4.0, 5.0]
+    })
+    # Without groupby
+    result = _groupby_and_aggregate(data, SELECTED_VAR, None, weighted=True)
+    assert result[SELECTED_VAR].tolist() == [1, 3]
+    assert result[WEIGHT_KEY].tolist() == [6.0, 9.5]
+    # With groupby, unweighted. Absent combinations are not included.
+    result = _groupby_and_aggregate(
+        data, SELECTED_VAR, GROUPBY_VAR, weighted=False)
+    assert result[SELECTED_VAR].tolist() == [1, 3, 3]
+    assert result[GROUPBY_VAR].tolist() == [2, 0, 2]
+    assert result[WEIGHT_KEY].tolist() == [2, 1, 2]
+
+
+def test_narrow_dtypes() -> None:
+    data = pd.DataFrame({
+        SELECTED_VAR: [1, 2, 99],
+        GROUPBY_VAR: [1, 300, 2],
+        WEIGHT_KEY: [1.5, 2.0, 3.0]
+    })
+    result = narrow_dtypes(data)
+    assert result[SELECTED_VAR].dtype == 'int8'
+    assert result[GROUPBY_VAR].dtype == 'int16'
+    assert result[WEIGHT_KEY].dtype == 'float64'
+    assert result.equals(data.astype(result.dtypes))
@@ -1,6 +1,7 @@
 import argparse
 import json
 import pathlib
+import numpy as np
 import pandas as pd
 from pandera import Column, DataFrameSchema, Check
 # from pandera.errors import SchemaErrors
@@ -172,16 +173,17 @@ def validate_freqs(s: pd.Series, survey_var: dict) -> bool:
 
     Returns:
         bool: True if frequencies match, False otherwise."""
-    # Get value counts of the column, and reorder according to their order
-    # in the codebook.
+    # Get counts of each code in the column, in their order in the codebook.
     codes = [int(e) for e in survey_var[SVK.CODE]]
     freqs = [int(e) for e in survey_var[SVK.FREQUENCY]]
-    # Reorder the value_counts according to the codebook,
-    # then drop the index to compare.
-    s = s.value_counts().reindex(codes)
-    s = s.reset_index(drop=True)
+    # Codes are small non-negative ints, so count them directly with
+    # bincount, then index out the codebook codes in order.
+    # Negative codes can't be counted this way, and are invalid anyways.
+    if s.min() < 0:
+        return False
+    counts = np.bincount(s.to_numpy(), minlength=max(codes) + 1)[codes]
     # Compare to the frequencies in the codebook.
-    return s.equals(pd.Series(freqs))
+    return pd.Series(counts).equals(pd.Series(freqs))
 
 
 def validate_PROBCNTP_freqs(s: pd.Series, survey_var: dict) -> bool: